@@ -1,7 +1,16 @@
 import streamlit as st
 import pandas as pd
-import random
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import os
+import html
+import math
+import functools
+import sqlite3
+import uuid
+from contextlib import closing
 
 # -----------------------------------------------------------------------------
 # CONFIGURATION & STYLING
@@ -14,7 +23,7 @@ st.set_page_config(
 )
 
 # Custom CSS for a cleaner, "Notion-like" aesthetic
-st.markdown("""
+CSS = """
 <style>
     /* Main Background adjustments */
     .stApp {
@@ -54,18 +63,36 @@ st.markdown("""
         margin-bottom: 15px;
     }
 
+    /* Bookmarked question list */
+    .qitem {
+        padding: 12px 0;
+        border-bottom: 1px solid #374151;
+    }
+
+    .qitem small {
+        color: #9ca3af;
+    }
+
     /* Success/Info Message Styling */
     .stSuccess {
         background-color: #064e3b;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+# Collapsed once at import so each rerun sends the smallest possible payload
+CSS_MINIFIED = " ".join(CSS.split())
+
+st.markdown(CSS_MINIFIED, unsafe_allow_html=True)
 
 # -----------------------------------------------------------------------------
 # DATA LOADING & SESSION STATE
 # -----------------------------------------------------------------------------
 
 FILE_PATH = './500_React_Interview_Questions.csv'
+PAGE_SIZE = 25  # Questions rendered per page in Browse
+MIN_SEARCH_LEN = 2  # Shorter queries match nearly everything, so they are not searched
+QITEM_HTML = '<div class="qitem"><h3>%d. %s</h3><p><b>Answer:</b> %s</p><small>Category: %s</small></div>'
+BOOKMARKS_DB = './bookmarks.db'
 
 def create_demo_data():
     """Creates a dummy CSV if the real one isn't found, prevents crash."""
@@ -88,28 +115,109 @@ def create_demo_data():
         ]
     }
     df = pd.DataFrame(data)
-    df.to_csv(FILE_PATH, index=False)
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), FILE_PATH)
     return df
 
-@st.cache_data
+COLUMN_DTYPES = {'ID': 'int32', 'Category': 'string[pyarrow]', 'Question': 'string[pyarrow]', 'Answer': 'string[pyarrow]'}
+
+def prepare_data(df):
+    """Narrows ID to int32 and text columns to Arrow strings, adds the lowercased `_search` column
+    and precomputes the sorted categories, category -> row index lookup and an ID index
+    whose positions match df rows."""
+    if df.empty:
+        df['_search'] = pd.Series(dtype='string[pyarrow]')
+        return df, [], {}, pd.Index([], dtype='int32')
+    df = df.astype(COLUMN_DTYPES)
+    # Lower and join in Arrow so the search column is built in one buffer pass
+    q = pc.utf8_lower(pa.array(df['Question'].array))
+    a = pc.utf8_lower(pa.array(df['Answer'].array))
+    joined = pc.binary_join_element_wise(q, a, pa.scalar('\x1f', q.type))
+    df['_search'] = pd.array(joined, dtype='string[pyarrow]')
+    cat_to_ids = df.groupby('Category').indices
+    all_categories = sorted(cat_to_ids)
+    id_index = pd.Index(df['ID'].to_numpy())
+    return df, all_categories, cat_to_ids, id_index
+
+# cache_resource hands every session the same objects without a pickle round-trip,
+# so the returned df and lookups are read-only and must never be mutated
+@st.cache_resource
 def load_data():
     if not os.path.exists(FILE_PATH):
-        return create_demo_data()
-    try:
-        df = pd.read_csv(FILE_PATH)
-        # Ensure columns exist even if CSV is slightly malformed
-        required_cols = ['ID', 'Category', 'Question', 'Answer']
-        if not all(col in df.columns for col in required_cols):
-            st.error("CSV is missing required columns: ID, Category, Question, Answer")
-            return pd.DataFrame(columns=required_cols)
-        return df
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        return pd.DataFrame()
+        df = create_demo_data()
+    else:
+        try:
+            df = pd.read_csv(FILE_PATH, engine='pyarrow', dtype_backend='pyarrow', dtype={'ID': 'int32'})
+            # Ensure columns exist even if CSV is slightly malformed
+            required_cols = ['ID', 'Category', 'Question', 'Answer']
+            if not all(col in df.columns for col in required_cols):
+                st.error("CSV is missing required columns: ID, Category, Question, Answer")
+                df = pd.DataFrame(columns=required_cols)
+        except Exception as e:
+            st.error(f"Error loading data: {e}")
+            df = pd.DataFrame()
+    return prepare_data(df)
+
+@st.cache_data
+def filter_by_cats(_df, _cat_to_ids, cats):
+    """Returns the rows of the loaded df in the given categories, cached per selection.
+    The original index is kept, so labels stay equal to row positions in df."""
+    ids = np.sort(np.concatenate([_cat_to_ids[c] for c in cats]))
+    return _df.iloc[ids]
+
+@functools.lru_cache(maxsize=1024)
+def card_html(qid, category, question):
+    """Builds the flashcard markup; card content is immutable for a given CSV, so it is memoized."""
+    return f"""
+    <div class="flashcard">
+        <span class="category-tag">{html.escape(category)}</span>
+        <div class="question-text">#{qid}: {html.escape(question)}</div>
+    </div>
+    """
+
+@st.cache_resource
+def init_bookmarks_db():
+    """Creates the bookmarks table once per process."""
+    with closing(sqlite3.connect(BOOKMARKS_DB)) as conn, conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS bookmarks (user_id TEXT, qid INTEGER, PRIMARY KEY (user_id, qid))")
+
+def load_bookmarks(user_id):
+    """Returns the persisted bookmark IDs for a user."""
+    with closing(sqlite3.connect(BOOKMARKS_DB)) as conn:
+        return [qid for (qid,) in conn.execute("SELECT qid FROM bookmarks WHERE user_id = ?", (user_id,))]
+
+def set_bookmarks(positions, values):
+    """Updates the bookmark mask at the given row positions and persists the change."""
+    positions = np.atleast_1d(positions)
+    values = np.broadcast_to(values, positions.shape)
+    st.session_state.bookmarks[positions] = values
+    user_id = st.session_state.user_id
+    qids = df['ID'].to_numpy()[positions].tolist()
+    with closing(sqlite3.connect(BOOKMARKS_DB)) as conn, conn:
+        conn.executemany("INSERT OR IGNORE INTO bookmarks VALUES (?, ?)",
+                         [(user_id, qid) for qid, v in zip(qids, values) if v])
+        conn.executemany("DELETE FROM bookmarks WHERE user_id = ? AND qid = ?",
+                         [(user_id, qid) for qid, v in zip(qids, values) if not v])
+
+def clear_bookmarks():
+    """Drops every bookmark for the current user."""
+    st.session_state.bookmarks = np.zeros(len(df), dtype=bool)
+    with closing(sqlite3.connect(BOOKMARKS_DB)) as conn, conn:
+        conn.execute("DELETE FROM bookmarks WHERE user_id = ?", (st.session_state.user_id,))
+
+df, all_categories, cat_to_ids, id_index = load_data()
+total_q = len(df)
+init_bookmarks_db()
 
 # Initialize Session State
-if 'bookmarks' not in st.session_state:
-    st.session_state.bookmarks = set()
+# Users are keyed by the ?u= query param so bookmarks survive reloads of the same URL
+if 'user_id' not in st.session_state:
+    st.session_state.user_id = st.query_params.get('u') or uuid.uuid4().hex
+st.query_params['u'] = st.session_state.user_id
+# Bookmarks are a boolean mask over row positions in df, hydrated from the DB
+if 'bookmarks' not in st.session_state or len(st.session_state.bookmarks) != total_q:
+    st.session_state.bookmarks = np.zeros(total_q, dtype=bool)
+    saved = id_index.get_indexer_for(load_bookmarks(st.session_state.user_id))
+    st.session_state.bookmarks[saved[saved >= 0]] = True
 if 'current_index' not in st.session_state:
     st.session_state.current_index = 0
 if 'reveal' not in st.session_state:
@@ -117,8 +225,6 @@ if 'reveal' not in st.session_state:
 if 'random_mode' not in st.session_state:
     st.session_state.random_mode = False
 
-df = load_data()
-
 # -----------------------------------------------------------------------------
 # SIDEBAR
 # -----------------------------------------------------------------------------
@@ -136,7 +242,6 @@ with st.sidebar:
     st.write("---")
     
     # Global Filters (Apply to all views mostly)
-    all_categories = sorted(df['Category'].astype(str).unique().tolist())
     selected_categories = st.multiselect(
         "Filter by Category", 
         all_categories,
@@ -147,71 +252,68 @@ with st.sidebar:
     # Progress
     st.write("---")
     st.subheader("Progress")
-    total_q = len(df)
-    bookmarked_q = len(st.session_state.bookmarks)
+    bookmarked_q = int(st.session_state.bookmarks.sum())
     st.metric("Total Questions", total_q)
     st.metric("Bookmarked for Review", bookmarked_q)
     
     if st.button("Clear Bookmarks", type="secondary"):
-        st.session_state.bookmarks = set()
+        clear_bookmarks()
         st.rerun()
 
 # Filter Data based on Sidebar
 if selected_categories:
-    filtered_df = df[df['Category'].isin(selected_categories)].reset_index(drop=True)
+    filtered_df = filter_by_cats(df, cat_to_ids, frozenset(selected_categories))
 else:
     filtered_df = df
+n_filtered = len(filtered_df)
 
 # -----------------------------------------------------------------------------
 # PAGE: BROWSE & SEARCH
 # -----------------------------------------------------------------------------
 if mode == "📚 Browse & Search":
     st.header("Explore the Questions")
-    st.caption(f"Displaying {len(filtered_df)} of {len(df)} total questions.")
+    st.caption(f"Displaying {n_filtered} of {total_q} total questions.")
     
     # Search Bar
     search_query = st.text_input("", placeholder="Search within the selected category...", label_visibility="collapsed")
     
-    if search_query:
-        display_df = filtered_df[
-            filtered_df['Question'].str.contains(search_query, case=False) | 
-            filtered_df['Answer'].str.contains(search_query, case=False)
-        ]
+    if len(search_query) >= MIN_SEARCH_LEN:
+        # _search is already lowercased, so a plain (non-regex) Arrow substring kernel suffices
+        matches = pc.match_substring(pa.array(filtered_df['_search'].array), search_query.lower())
+        display_df = filtered_df[matches.fill_null(False).to_numpy(zero_copy_only=False)]
     else:
+        if search_query:
+            st.caption(f"Type at least {MIN_SEARCH_LEN} characters to search.")
         display_df = filtered_df
     
+    # Pagination keeps the rendered row count at PAGE_SIZE regardless of matches
+    n_pages = max(1, math.ceil(len(display_df) / PAGE_SIZE))
+    page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, step=1)
+    page_df = display_df.iloc[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+    
     st.write("---")
 
-    # Display list in "Clean Read" mode
-    for index, row in display_df.iterrows():
-        # Using a container for better grouping
-        with st.container():
-            # Question Header
-            st.subheader(f"{row['ID']}. {row['Question']}")
-            
-            # Answer Body
-            st.markdown(f"**Answer:** {row['Answer']}")
-            
-            # Metadata & Actions row
-            col_info, col_btn = st.columns([6, 1])
-            
-            with col_info:
-                st.caption(f"Category: {row['Category']}")
-                
-            with col_btn:
-                is_bookmarked = row['ID'] in st.session_state.bookmarks
-                # Minimal button with icon
-                icon = "★" if is_bookmarked else "☆"
-                help_text = "Remove from bookmarks" if is_bookmarked else "Add to bookmarks"
-                
-                if st.button(icon, key=f"browse_bm_{row['ID']}", help=help_text):
-                    if is_bookmarked:
-                        st.session_state.bookmarks.remove(row['ID'])
-                    else:
-                        st.session_state.bookmarks.add(row['ID'])
-                    st.rerun()
-            
-            st.divider()
+    # Display the page as a single table widget; bookmarks are toggled via the checkbox column
+    positions = page_df.index.to_numpy()
+    view = page_df[['ID', 'Category', 'Question', 'Answer']].assign(bm=st.session_state.bookmarks[positions])
+    edited = st.data_editor(
+        view,
+        column_config={
+            'bm': st.column_config.CheckboxColumn("★", help="Add to / remove from bookmarks"),
+            'Question': st.column_config.TextColumn(width="medium"),
+            'Answer': st.column_config.TextColumn(width="large"),
+        },
+        disabled=['ID', 'Category', 'Question', 'Answer'],
+        hide_index=True,
+        use_container_width=True
+    )
+    
+    # Apply all checkbox changes in one pass
+    new_bm = edited['bm'].to_numpy(dtype=bool)
+    changed = new_bm != view['bm'].to_numpy()
+    if changed.any():
+        set_bookmarks(positions[changed], new_bm[changed])
+        st.rerun()
 
 # -----------------------------------------------------------------------------
 # PAGE: FLASHCARDS
@@ -223,30 +325,40 @@ elif mode == "🃏 Flashcards":
         st.warning("No questions found with current filters.")
     else:
         # Navigation Logic
-        if st.session_state.current_index >= len(filtered_df):
+        if st.session_state.current_index >= n_filtered:
             st.session_state.current_index = 0
+        
+        # Shuffle once per filter selection and step through it, so Random never repeats until exhausted
+        perm_key = frozenset(selected_categories)
+        if st.session_state.get('rand_key') != perm_key or len(st.session_state.rand_perm) != n_filtered:
+            st.session_state.rand_perm = np.random.permutation(n_filtered)
+            st.session_state.rand_pos = 0
+            st.session_state.rand_key = perm_key
             
         current_q = filtered_df.iloc[st.session_state.current_index]
         q_id = current_q['ID']
+        q_pos = current_q.name
         
         # Top Controls
         col_prev, col_rand, col_next = st.columns([1, 2, 1])
         
         with col_prev:
             if st.button("⬅️ Previous"):
-                st.session_state.current_index = (st.session_state.current_index - 1) % len(filtered_df)
+                st.session_state.current_index = (st.session_state.current_index - 1) % n_filtered
                 st.session_state.reveal = False
                 st.rerun()
                 
         with col_rand:
             if st.button("🎲 Random Question", use_container_width=True):
-                st.session_state.current_index = random.randint(0, len(filtered_df) - 1)
+                pos = st.session_state.rand_pos
+                st.session_state.current_index = int(st.session_state.rand_perm[pos])
+                st.session_state.rand_pos = (pos + 1) % n_filtered
                 st.session_state.reveal = False
                 st.rerun()
         
         with col_next:
             if st.button("Next ➡️"):
-                st.session_state.current_index = (st.session_state.current_index + 1) % len(filtered_df)
+                st.session_state.current_index = (st.session_state.current_index + 1) % n_filtered
                 st.session_state.reveal = False
                 st.rerun()
 
@@ -255,25 +367,17 @@ elif mode == "🃏 Flashcards":
         # THE FLASHCARD UI
         
         # Bookmark status for current card
-        is_bm = q_id in st.session_state.bookmarks
+        is_bm = st.session_state.bookmarks[q_pos]
         bm_text = "★ Bookmarked" if is_bm else "☆ Add to Bookmarks"
         
         # Render Card
-        st.markdown(f"""
-        <div class="flashcard">
-            <span class="category-tag">{current_q['Category']}</span>
-            <div class="question-text">#{q_id}: {current_q['Question']}</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(card_html(int(q_id), current_q['Category'], current_q['Question']), unsafe_allow_html=True)
         
         # Actions Row
         c1, c2, c3 = st.columns([1, 2, 1])
         with c2:
             if st.button(bm_text, use_container_width=True):
-                if is_bm:
-                    st.session_state.bookmarks.remove(q_id)
-                else:
-                    st.session_state.bookmarks.add(q_id)
+                set_bookmarks(q_pos, not is_bm)
                 st.rerun()
 
             reveal_btn = st.button("👁️ Reveal Answer", type="primary", use_container_width=True)
@@ -300,22 +404,28 @@ elif mode == "🃏 Flashcards":
 elif mode == "🔖 My Bookmarks":
     st.header("My Bookmarks")
     
-    if not st.session_state.bookmarks:
+    if not st.session_state.bookmarks.any():
         st.info("You haven't bookmarked any questions yet. Go to 'Browse' or 'Flashcards' to add some!")
     else:
         # Filter main DF by bookmarks
-        bookmark_df = df[df['ID'].isin(st.session_state.bookmarks)]
+        bookmark_df = df.loc[st.session_state.bookmarks]
         
         st.markdown(f"You have **{len(bookmark_df)}** questions marked for review.")
         
-        for index, row in bookmark_df.iterrows():
-            st.subheader(f"{row['ID']}. {row['Question']}")
-            st.markdown(f"**Answer:** {row['Answer']}")
-            
-            if st.button("Remove Bookmark", key=f"rm_{row['ID']}"):
-                st.session_state.bookmarks.remove(row['ID'])
-                st.rerun()
-            st.divider()
+        ids, cats, qs, ans = (bookmark_df[c].to_numpy() for c in ('ID', 'Category', 'Question', 'Answer'))
+        
+        # Removal is one compact multiselect instead of a button per question
+        to_remove = st.multiselect("Remove bookmarks", ids.tolist(), placeholder="Select question IDs...")
+        if st.button("Remove Selected", disabled=not to_remove):
+            set_bookmarks(id_index.get_indexer_for(to_remove), False)
+            st.rerun()
+        
+        # Render the whole list as a single markdown element
+        chunks = [
+            QITEM_HTML % (qid, html.escape(q), html.escape(a), html.escape(cat))
+            for qid, cat, q, a in zip(ids, cats, qs, ans)
+        ]
+        st.markdown('\n'.join(chunks), unsafe_allow_html=True)
 
 # -----------------------------------------------------------------------------
 # FOOTER